@@ -6,14 +6,71 @@ Used to provide DDNS service for dynamic IP addresses.
 Requires the DNS record to be pre-created on Cloudflare.
 """
 
-import json
 import sys
 import time
 import signal
+import orjson
 import requests
-import schedule
+import dns.exception
+import dns.resolver
+from concurrent.futures import ThreadPoolExecutor
+from ipaddress import IPv4Address
 from pathlib import Path
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Cloudflare API base URL and timeout (seconds) applied to every HTTP call
+CLOUDFLARE_API_URL = "https://api.cloudflare.com/client/v4"
+REQUEST_TIMEOUT = 10
+
+# Seconds between two DNS checks
+CHECK_INTERVAL = 60
+
+# Shared HTTP session, reused across checks to keep connections alive
+SESSION = None
+
+# Cloudflare API request headers, built once from the configuration by main()
+_CF_HEADERS = None
+
+# Shared DNS resolver used to read the record as published by Cloudflare
+RESOLVER = None
+
+
+def setup_session():
+    """Create the shared HTTP session with a small connection pool and retries"""
+    global SESSION
+
+    # Retries must stay well inside CHECK_INTERVAL: Retry-After is ignored and a 429 waits for the next check.
+    # Once retries are exhausted the last response is returned so raise_for_status() reports it.
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        backoff_max=5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET", "PUT"],
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+
+    SESSION = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+    SESSION.mount("http://", adapter)
+    SESSION.mount("https://", adapter)
+
+    logger.debug("HTTP session initialized")
+
+
+def setup_resolver():
+    """Create the shared DNS resolver pointing at Cloudflare's public resolvers"""
+    global RESOLVER
+
+    RESOLVER = dns.resolver.Resolver(configure=False)
+    RESOLVER.nameservers = ['1.1.1.1', '1.0.0.1']
+    RESOLVER.lifetime = 5
+
+    logger.debug("DNS resolver initialized")
 
 
 def setup_logging():
@@ -29,7 +86,8 @@ def setup_logging():
     logger.add(
         sys.stdout, 
         level="INFO",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+        enqueue=True  # Write from a background thread so checks never block on stdout
     )    
 
     # Add file handler with rotation
@@ -46,142 +104,162 @@ def setup_logging():
     logger.info("Logging initialized")
 
 
+class ConfigError(Exception):
+    """Raised when the configuration file is missing or invalid"""
+
+
 def load_config(config_path="config/config.json"):
-    """Load configuration from JSON file"""
+    """Load configuration from JSON file, raising ConfigError if it is missing or invalid"""
     config_file = Path(config_path)
 
     if not config_file.exists():
-        logger.error(f"Configuration file '{config_path}' not found")
-        logger.info("Please create a config.json file with the required parameters")
-        logger.info("See config.sample.json for an example")
-        sys.exit(1)
+        raise ConfigError(f"Configuration file '{config_path}' not found")
 
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-
-        # Validate required fields
-        required_fields = ['zone', 'dnsrecords', 'cloudflare_auth_email', 'cloudflare_auth_key']
-        missing_fields = [field for field in required_fields if field not in config]
-
-        if missing_fields:
-            logger.error(f"Missing required fields in config: {', '.join(missing_fields)}")
-            sys.exit(1)
-
-        logger.debug(f"Configuration loaded successfully from {config_path}")
-        return config
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in configuration file: {e}")
-        sys.exit(1)
+        config = orjson.loads(config_file.read_bytes())
+    except OSError as e:
+        raise ConfigError(f"Could not read configuration file '{config_path}': {e}") from e
+    except orjson.JSONDecodeError as e:
+        raise ConfigError(f"Invalid JSON in configuration file: {e}") from e
+
+    if not isinstance(config, dict):
+        raise ConfigError("Configuration file must contain a JSON object")
+
+    # Validate required fields; an API token replaces the legacy email + global key pair
+    required_fields = ['zone', 'dnsrecords']
+    if not config.get('cloudflare_api_token'):
+        required_fields += ['cloudflare_auth_email', 'cloudflare_auth_key']
+    missing_fields = [field for field in required_fields if field not in config]
+
+    if missing_fields:
+        raise ConfigError(f"Missing required fields in config: {', '.join(missing_fields)}")
+
+    logger.debug("Configuration loaded successfully from {}", config_path)
+    return config
+
+
+def build_cloudflare_headers(config):
+    """Build the Cloudflare API request headers from the configuration"""
+    if config.get('cloudflare_api_token'):
+        return {
+            "Authorization": f"Bearer {config['cloudflare_api_token']}",
+            "Content-Type": "application/json"
+        }
+
+    return {
+        "X-Auth-Email": config['cloudflare_auth_email'],
+        "X-Auth-Key": config['cloudflare_auth_key'],
+        "Content-Type": "application/json"
+    }
 
 
 def get_external_ip():
     """Get the current external IP address"""
     try:
         logger.debug("Fetching external IP address from checkip.amazonaws.com")
-        response = requests.get("https://checkip.amazonaws.com", timeout=10)
+        response = SESSION.get("https://checkip.amazonaws.com", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        ip = response.text.strip()
-        logger.debug(f"External IP retrieved: {ip}")
+        # Reject anything that is not an IPv4 address before it can reach Cloudflare
+        ip = str(parse_ipv4(response.text))
+        logger.debug("External IP retrieved: {}", ip)
         return ip
     except requests.RequestException as e:
-        logger.error(f"Error getting external IP: {e}")
+        logger.error("Error getting external IP: {}", e)
+        raise
+    except ValueError as e:
+        logger.error("Invalid external IP received: {}", e)
         raise
 
 
-def get_cloudflare_dns_ip(dnsrecord):
-    """Get the current IP from Cloudflare DNS using their API resolver"""
+def parse_ipv4(ip):
+    """Parse a dotted-quad IPv4 address, tolerating surrounding whitespace and leading zeros"""
+    parts = ip.strip().split('.')
+    if len(parts) != 4 or not all(part.isascii() and part.isdigit() for part in parts):
+        raise ValueError(f"'{ip}' does not appear to be an IPv4 address")
+
+    # IPv4Address rejects leading zeros, so normalize each octet as a decimal number first
+    return IPv4Address('.'.join(str(int(part)) for part in parts))
+
+
+def ips_match(ip_a, ip_b):
+    """Compare two IPv4 addresses by value rather than by their string form"""
     try:
-        logger.debug(f"Querying Cloudflare DNS for {dnsrecord}")
-        response = requests.get(
-            f"https://1.1.1.1/dns-query?name={dnsrecord}&type=A",
-            headers={"Accept": "application/dns-json"},
-            timeout=10
-        )
-        response.raise_for_status()
-        data = response.json()
+        return parse_ipv4(ip_a) == parse_ipv4(ip_b)
+    except (AttributeError, ValueError):
+        return False
 
-        if data.get('Answer'):
-            ip = data['Answer'][0]['data']
-            logger.debug(f"Cloudflare DNS returned: {ip}")
-            return ip
-        logger.debug(f"No DNS record found for {dnsrecord}")
+
+def get_cloudflare_dns_ip(dnsrecord):
+    """Get the current IP from Cloudflare DNS using their public resolver"""
+    try:
+        logger.debug("Querying Cloudflare DNS for {}", dnsrecord)
+        answer = RESOLVER.resolve(dnsrecord, 'A')
+        ip = answer[0].to_text()
+        logger.debug("Cloudflare DNS returned: {}", ip)
+        return ip
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        logger.debug("No DNS record found for {}", dnsrecord)
         return None
-    except requests.RequestException as e:
-        logger.warning(f"Could not query DNS via Cloudflare API: {e}")
+    except dns.exception.DNSException as e:
+        logger.warning("Could not query DNS via Cloudflare resolver: {}", e)
         return None
 
 
-def get_zone_id(zone, auth_email, auth_key):
+def get_zone_id(zone):
     """Get the Cloudflare zone ID for the given zone"""
-    url = f"https://api.cloudflare.com/client/v4/zones?name={zone}&status=active"
-    headers = {
-        "X-Auth-Email": auth_email,
-        "X-Auth-Key": auth_key,
-        "Content-Type": "application/json"
-    }
+    url = f"{CLOUDFLARE_API_URL}/zones?name={zone}&status=active"
 
     try:
-        logger.debug(f"Fetching zone ID for {zone}")
-        response = requests.get(url, headers=headers, timeout=10)
+        logger.debug("Fetching zone ID for {}", zone)
+        response = SESSION.get(url, headers=_CF_HEADERS, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if not data.get('success'):
-            logger.error(f"Cloudflare API returned error: {data.get('errors')}")
+            logger.error("Cloudflare API returned error: {}", data.get('errors'))
             raise Exception(f"Cloudflare API error: {data.get('errors')}")
 
         if not data.get('result'):
-            logger.error(f"Zone '{zone}' not found")
+            logger.error("Zone '{}' not found", zone)
             raise Exception(f"Zone '{zone}' not found")
 
         zone_id = data['result'][0]['id']
-        logger.debug(f"Zone ID for {zone}: {zone_id}")
+        logger.debug("Zone ID for {}: {}", zone, zone_id)
         return zone_id
-    except requests.RequestException as e:
-        logger.error(f"Error getting zone ID: {e}")
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logger.error("Error getting zone ID: {}", e)
         raise
 
 
-def get_dns_record_id(zone_id, dnsrecord, auth_email, auth_key):
+def get_dns_record_id(zone_id, dnsrecord):
     """Get the DNS record ID for the given A record"""
-    url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/dns_records?type=A&name={dnsrecord}"
-    headers = {
-        "X-Auth-Email": auth_email,
-        "X-Auth-Key": auth_key,
-        "Content-Type": "application/json"
-    }
+    url = f"{CLOUDFLARE_API_URL}/zones/{zone_id}/dns_records?type=A&name={dnsrecord}"
 
     try:
-        logger.debug(f"Fetching DNS record ID for {dnsrecord}")
-        response = requests.get(url, headers=headers, timeout=10)
+        logger.debug("Fetching DNS record ID for {}", dnsrecord)
+        response = SESSION.get(url, headers=_CF_HEADERS, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if not data.get('success'):
-            logger.error(f"Cloudflare API returned error: {data.get('errors')}")
+            logger.error("Cloudflare API returned error: {}", data.get('errors'))
             raise Exception(f"Cloudflare API error: {data.get('errors')}")
 
         if not data.get('result'):
-            logger.error(f"DNS record '{dnsrecord}' not found")
+            logger.error("DNS record '{}' not found", dnsrecord)
             raise Exception(f"DNS record '{dnsrecord}' not found")
 
         record_id = data['result'][0]['id']
-        logger.debug(f"DNS record ID for {dnsrecord}: {record_id}")
+        logger.debug("DNS record ID for {}: {}", dnsrecord, record_id)
         return record_id
-    except requests.RequestException as e:
-        logger.error(f"Error getting DNS record ID: {e}")
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logger.error("Error getting DNS record ID: {}", e)
         raise
 
 
-def update_dns_record(zone_id, record_id, dnsrecord, ip, auth_email, auth_key):
+def update_dns_record(zone_id, record_id, dnsrecord, ip):
     """Update the DNS A record with the new IP"""
-    url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/dns_records/{record_id}"
-    headers = {
-        "X-Auth-Email": auth_email,
-        "X-Auth-Key": auth_key,
-        "Content-Type": "application/json"
-    }
+    url = f"{CLOUDFLARE_API_URL}/zones/{zone_id}/dns_records/{record_id}"
     payload = {
         "type": "A",
         "name": dnsrecord,
@@ -191,73 +269,217 @@ def update_dns_record(zone_id, record_id, dnsrecord, ip, auth_email, auth_key):
     }
 
     try:
-        logger.debug(f"Updating DNS record {dnsrecord} to {ip}")
-        response = requests.put(url, headers=headers, json=payload, timeout=10)
+        logger.debug("Updating DNS record {} to {}", dnsrecord, ip)
+        response = SESSION.put(url, headers=_CF_HEADERS, data=orjson.dumps(payload), timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if not data.get('success'):
-            logger.error(f"Failed to update DNS record: {data.get('errors')}")
+            logger.error("Failed to update DNS record: {}", data.get('errors'))
             raise Exception(f"Failed to update DNS record: {data.get('errors')}")
 
-        logger.debug(f"DNS record updated successfully")
+        logger.debug("DNS record updated successfully")
         return data
-    except requests.RequestException as e:
-        logger.error(f"Error updating DNS record: {e}")
+    except requests.HTTPError as e:
+        # A 404 means the cached IDs are stale; the caller resolves them again and retries
+        if e.response is None or e.response.status_code != 404:
+            logger.error("Error updating DNS record: {}", e)
+        raise
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logger.error("Error updating DNS record: {}", e)
         raise
 
 
 # Global configuration storage
 _config = None
 
+# Cloudflare zone and DNS record IDs never change for a given name, so they are
+# resolved once and persisted to avoid extra API calls on every update.
+# Kept out of config/, which is mounted read-only in Docker.
+ID_CACHE_PATH = "data/id_cache.json"
+_zone_id_cache = None
+_record_id_cache = {}
+
+# Last external IP confirmed on Cloudflare, and when (monotonic seconds); while it
+# stays the same, Cloudflare is only re-verified every IP_CACHE_TTL seconds
+IP_CACHE_TTL = 600
+_last_ip = None
+_last_checked = 0.0
+
+
+def load_id_cache(zone, cache_path=ID_CACHE_PATH):
+    """Load previously resolved zone and DNS record IDs from disk"""
+    global _zone_id_cache, _record_id_cache
+
+    cache_file = Path(cache_path)
+    if not cache_file.exists():
+        return
+
+    try:
+        cache = orjson.loads(cache_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable ID cache '{}': {}", cache_path, e)
+        return
+
+    if not isinstance(cache, dict):
+        logger.warning("Ignoring unreadable ID cache '{}': not a JSON object", cache_path)
+        return
+
+    # IDs cached for a different zone are of no use
+    if cache.get('zone') != zone:
+        logger.debug("ID cache is for zone {}, ignoring it", cache.get('zone'))
+        return
+
+    zone_id = cache.get('zone_id')
+    record_ids = cache.get('record_ids') or {}
+    if (not isinstance(zone_id, (str, type(None)))
+            or not isinstance(record_ids, dict)
+            or not all(isinstance(record_id, str) for record_id in record_ids.values())):
+        logger.warning("Ignoring unreadable ID cache '{}': unexpected contents", cache_path)
+        return
+
+    _zone_id_cache = zone_id
+    _record_id_cache = record_ids
+    logger.debug("ID cache loaded from {}", cache_path)
+
+
+def save_id_cache(zone, cache_path=ID_CACHE_PATH):
+    """Persist the resolved zone and DNS record IDs to disk"""
+    cache = {
+        "zone": zone,
+        "zone_id": _zone_id_cache,
+        "record_ids": _record_id_cache
+    }
+
+    try:
+        cache_file = Path(cache_path)
+        cache_file.parent.mkdir(exist_ok=True)
+        cache_file.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+        logger.debug("ID cache saved to {}", cache_path)
+    except OSError as e:
+        # The in-memory cache still applies
+        logger.warning("Could not save ID cache to '{}': {}", cache_path, e)
+
+
+def clear_id_cache():
+    """Forget all cached zone and DNS record IDs"""
+    global _zone_id_cache, _record_id_cache
+    _zone_id_cache = None
+    _record_id_cache = {}
+
+
+def get_cached_ids(zone, dnsrecord):
+    """Get the zone and DNS record IDs, resolving them via the API only when not cached"""
+    global _zone_id_cache
+
+    resolved = False
+
+    if _zone_id_cache is None:
+        _zone_id_cache = get_zone_id(zone)
+        logger.info("\tZone ID for {} is {}", zone, _zone_id_cache)
+        resolved = True
+
+    if dnsrecord not in _record_id_cache:
+        _record_id_cache[dnsrecord] = get_dns_record_id(_zone_id_cache, dnsrecord)
+        logger.info("\tDNS record ID for {} is {}", dnsrecord, _record_id_cache[dnsrecord])
+        resolved = True
+
+    if resolved:
+        save_id_cache(zone)
+
+    return _zone_id_cache, _record_id_cache[dnsrecord]
+
+
+def lookup_ips(dnsrecords, current_ip=None):
+    """Get the external IP (unless already known) and the Cloudflare DNS IP of each record concurrently"""
+    with ThreadPoolExecutor(max_workers=min(len(dnsrecords) + 1, 8)) as executor:
+        external_ip_future = executor.submit(get_external_ip) if current_ip is None else None
+        cf_ip_futures = {
+            dnsrecord: executor.submit(get_cloudflare_dns_ip, dnsrecord)
+            for dnsrecord in dnsrecords
+        }
+
+        if external_ip_future is not None:
+            current_ip = external_ip_future.result()
+        cf_ips = {dnsrecord: future.result() for dnsrecord, future in cf_ip_futures.items()}
+
+    return current_ip, cf_ips
+
 
 def check_and_update_dns():
     """Check and update DNS record if needed"""
-    global _config
-    _config = load_config()
+    global _last_ip, _last_checked
 
+    # Configuration is loaded once at startup by main()
     zone = _config['zone']
     dnsrecords = _config['dnsrecords']
-    auth_email = _config['cloudflare_auth_email']
-    auth_key = _config['cloudflare_auth_key']
 
-    logger.info(f"Number of DNS records to be updated: {len(dnsrecords)}")
+    logger.debug("Number of DNS records to be updated: {}", len(dnsrecords))
 
-    for dnsrecord in dnsrecords:
-        logger.info(f"\t{'-' * 20}")
-        logger.info(f"\tStarting DNS update check for {dnsrecord}")
+    # While a recently confirmed IP is still fresh, fetch only the external IP first;
+    # otherwise verification is due anyway, so fetch it together with the Cloudflare lookups
+    cache_fresh = _last_ip is not None and time.monotonic() - _last_checked < IP_CACHE_TTL
 
-        try:
-            # Get current external IP
+    try:
+        if cache_fresh:
             current_ip = get_external_ip()
-            logger.info(f"\tCurrent IP is {current_ip}")
+            logger.debug("Current IP is {}", current_ip)
+
+            if current_ip == _last_ip:
+                logger.debug("IP unchanged since last verification; no changes needed")
+                return
 
-            # Get current Cloudflare DNS IP
-            cf_ip = get_cloudflare_dns_ip(dnsrecord)
-            logger.info(f"\tCloudflare IP is {cf_ip}")
+            current_ip, cf_ips = lookup_ips(dnsrecords, current_ip)
+        else:
+            current_ip, cf_ips = lookup_ips(dnsrecords)
+            logger.debug("Current IP is {}", current_ip)
+    except Exception as e:
+        logger.error("Unexpected error during DNS lookup: {}", e)
+        return
+
+    in_sync = True
+
+    for dnsrecord in dnsrecords:
+        logger.debug("\tStarting DNS update check for {}", dnsrecord)
+
+        try:
+            cf_ip = cf_ips[dnsrecord]
+            logger.debug("\tCloudflare IP is {}", cf_ip)
 
             # Check if update is needed
-            if cf_ip and cf_ip == current_ip:
-                logger.info(f"\t{dnsrecord} is currently set to {current_ip}; no changes needed")
+            if ips_match(cf_ip, current_ip):
+                logger.debug("\t{} is currently set to {}; no changes needed", dnsrecord, current_ip)
                 continue
 
             # Update is needed
-            logger.warning(f"\tDNS record needs updating from {cf_ip} to {current_ip}")
+            logger.warning("\tDNS record needs updating from {} to {}", cf_ip, current_ip)
 
-            # Get zone ID
-            zone_id = get_zone_id(zone, auth_email, auth_key)
-            logger.info(f"\tZone ID for {zone} is {zone_id}")
-
-            # Get DNS record ID
-            record_id = get_dns_record_id(zone_id, dnsrecord, auth_email, auth_key)
-            logger.info(f"\tDNS record ID for {dnsrecord} is {record_id}")
+            # Get zone and DNS record IDs
+            zone_id, record_id = get_cached_ids(zone, dnsrecord)
 
             # Update the record
-            result = update_dns_record(zone_id, record_id, dnsrecord, current_ip, auth_email, auth_key)
-            logger.success(f"\tSuccessfully updated {dnsrecord} to {current_ip}")
-            logger.debug(f"\tResponse: {json.dumps(result, indent=2)}")
+            try:
+                result = update_dns_record(zone_id, record_id, dnsrecord, current_ip)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+
+                # Cached IDs are stale (zone or record was recreated); resolve them again and retry once
+                logger.info("\tCached IDs for {} are stale, resolving them again", dnsrecord)
+                clear_id_cache()
+                zone_id, record_id = get_cached_ids(zone, dnsrecord)
+                result = update_dns_record(zone_id, record_id, dnsrecord, current_ip)
+
+            logger.success("\tSuccessfully updated {} to {}", dnsrecord, current_ip)
+            logger.opt(lazy=True).debug("\tResponse: {}", lambda: orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
         except Exception as e:
-            logger.error(f"\tUnexpected error during DNS update: {e}")
+            logger.error("\tUnexpected error during DNS update: {}", e)
+            in_sync = False
+
+    # Remember the IP only once every record is confirmed to point at it
+    if in_sync:
+        _last_ip = current_ip
+        _last_checked = time.monotonic()
 
 
 def signal_handler(signum, frame):
@@ -268,31 +490,51 @@ def signal_handler(signum, frame):
 
 def main():
     """Main function to setup and run the scheduler"""
-    global _config
+    global _config, _CF_HEADERS
 
     # Setup logging
     setup_logging()
 
+    # Setup the shared HTTP session and DNS resolver
+    setup_session()
+    setup_resolver()
+
     # Load configuration
-    _config = load_config()
+    try:
+        _config = load_config()
+    except ConfigError as e:
+        logger.error("{}", e)
+        logger.info("Please create config/config.json with the required parameters")
+        logger.info("See config.sample.json for an example")
+        sys.exit(1)
+
+    _CF_HEADERS = build_cloudflare_headers(_config)
+
+    # Load cached Cloudflare IDs
+    load_id_cache(_config['zone'])
 
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    logger.info(f"DNS Update Scheduler started for {_config['dnsrecords']}")
-    logger.info("Running checks every 1 minute. Press Ctrl+C to stop.")
-
-    # Schedule the job to run every 1 minute
-    schedule.every(1).minutes.do(check_and_update_dns)
+    logger.info("DNS Update Scheduler started for {}", _config['dnsrecords'])
+    logger.info("Running checks every {} seconds. Press Ctrl+C to stop.", CHECK_INTERVAL)
 
-    # Run the job immediately on startup
-    check_and_update_dns()
-
-    # Keep the scheduler running
+    # Run a check immediately on startup, then every CHECK_INTERVAL seconds.
+    # Sleeping until the next absolute tick avoids drift from the check duration.
+    next_tick = time.monotonic()
     while True:
-        schedule.run_pending()
-        time.sleep(1)
+        try:
+            check_and_update_dns()
+        except Exception:
+            logger.exception("Unexpected error during scheduled check")
+
+        # If a check overran the interval, skip the missed ticks instead of running them back to back
+        now = time.monotonic()
+        next_tick += CHECK_INTERVAL
+        if next_tick < now:
+            next_tick = now + CHECK_INTERVAL
+        time.sleep(next_tick - now)
 
 
 if __name__ == "__main__":